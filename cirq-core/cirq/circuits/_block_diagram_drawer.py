@@ -159,8 +159,8 @@ class BlockDiagramDrawer:
 
     def __init__(self) -> None:
         self._blocks: Dict[Tuple[int, int], Block] = collections.defaultdict(Block)
-        self._min_widths: Dict[int, int] = collections.defaultdict(lambda: 0)
-        self._min_heights: Dict[int, int] = collections.defaultdict(lambda: 0)
+        self._min_widths: Dict[int, int] = collections.defaultdict(int)
+        self._min_heights: Dict[int, int] = collections.defaultdict(int)
 
         # Populate the origin.
         _ = self._blocks[(0, 0)]
@@ -219,45 +219,36 @@ class BlockDiagramDrawer:
                 max(y for _, y in self._blocks.keys()), max(self._min_heights.keys())
             )
 
-        # Method for accessing blocks without creating new entries.
-        empty = Block()
-
-        def block(x: int, y: int) -> Block:
-            return self._blocks.get((x, y), empty)
-
         # Determine the width of every column and the height of every row.
-        widths = {
-            x: max(
-                max(block(x, y).min_width() for y in range(block_span_y)),
-                self._min_widths.get(x, 0),
-                min_block_width,
-            )
-            for x in range(block_span_x)
-        }
+        # Blocks that were never accessed have no minimum size, so only the
+        # accessed blocks need to be measured.
+        widths = {x: max(self._min_widths.get(x, 0), min_block_width) for x in range(block_span_x)}
         heights = {
-            y: max(
-                max(block(x, y).min_height() for x in range(block_span_x)),
-                self._min_heights.get(y, 0),
-                min_block_height,
-            )
-            for y in range(block_span_y)
-        }
-
-        # Get the individually rendered blocks.
-        block_renders = {
-            (x, y): block(x, y).render(widths[x], heights[y])
-            for x in range(block_span_x)
-            for y in range(block_span_y)
+            y: max(self._min_heights.get(y, 0), min_block_height) for y in range(block_span_y)
         }
+        for (x, y), b in self._blocks.items():
+            if x < block_span_x and y < block_span_y:
+                widths[x] = max(widths[x], b.min_width())
+                heights[y] = max(heights[y], b.min_height())
+
+        # Get the individually rendered blocks. Blocks that were never
+        # accessed render as blank space, so share one padding string per
+        # column instead of rendering them character by character.
+        blanks = {x: ' ' * widths[x] for x in range(block_span_x)}
+        block_renders: Dict[Tuple[int, int], List[str]] = {}
+        for x in range(block_span_x):
+            for y in range(block_span_y):
+                b = self._blocks.get((x, y))
+                block_renders[x, y] = (
+                    [blanks[x]] * heights[y] if b is None else b.render(widths[x], heights[y])
+                )
 
         # Paste together all of the rows of rendered block content.
         out_lines: List[str] = []
         for y in range(block_span_y):
             for by in range(heights[y]):
-                out_line_chunks: List[str] = []
-                for x in range(block_span_x):
-                    out_line_chunks.extend(block_renders[x, y][by])
-                out_lines.append(''.join(out_line_chunks).rstrip())
+                out_line = ''.join(block_renders[x, y][by] for x in range(block_span_x))
+                out_lines.append(out_line.rstrip())
 
         # Then paste together the rows.
         return '\n'.join(out_lines)
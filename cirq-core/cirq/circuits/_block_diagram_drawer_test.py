@@ -449,6 +449,14 @@ def test_lines_stretch_content():
     )
 
 
+def test_blocks_outside_render_span_are_ignored():
+    d = BlockDiagramDrawer()
+    d.mutable_block(0, 0).content = 'A'
+    d.mutable_block(1, 0).content = 'wide\ntall'
+    d.mutable_block(0, 1).content = 'wider\ntaller'
+    _assert_same_diagram(d.render(block_span_x=1, block_span_y=1), 'A')
+
+
 def test_indices():
     d = BlockDiagramDrawer()
     with pytest.raises(IndexError):
@@ -39,22 +39,24 @@ _BoxDrawCharacterSet = NamedTuple(
 )
 
 
+def _field_index_for_legs(legs: int) -> int:
+    names = [name for bit, name in enumerate(('top', 'bottom', 'left', 'right')) if legs >> bit & 1]
+    return _BoxDrawCharacterSet._fields.index('_'.join(names))
+
+
+# Field index of the character for each non-empty combination of legs, keyed by
+# a bitmask with top=1, bottom=2, left=4 and right=8.
+_LEGS_TO_FIELD_INDEX = (-1,) + tuple(_field_index_for_legs(legs) for legs in range(1, 16))
+
+
 class BoxDrawCharacterSet(_BoxDrawCharacterSet):
     def char(
         self, top: bool = False, bottom: bool = False, left: bool = False, right: bool = False
     ) -> Optional[str]:
-        parts = []
-        if top:
-            parts.append('top')
-        if bottom:
-            parts.append('bottom')
-        if left:
-            parts.append('left')
-        if right:
-            parts.append('right')
-        if not parts:
+        legs = bool(top) | bool(bottom) << 1 | bool(left) << 2 | bool(right) << 3
+        if not legs:
             return None
-        return getattr(self, '_'.join(parts))
+        return self[_LEGS_TO_FIELD_INDEX[legs]]
 
 
 _MixedBoxDrawCharacterSet = NamedTuple(
@@ -372,8 +374,8 @@ def box_draw_character(
         A box drawing character approximating the desired properties, or None
         if all legs are set to 0.
     """
-    if first is None:
-        first = second
+    if first is None or first is second:
+        return second.char(top=bool(top), bottom=bool(bottom), left=bool(left), right=bool(right))
     sign = +1
     combo = None
 
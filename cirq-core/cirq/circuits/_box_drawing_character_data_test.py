@@ -14,6 +14,7 @@
 
 from cirq.circuits._box_drawing_character_data import (
     box_draw_character,
+    ASCII_BOX_CHARS,
     NORMAL_BOX_CHARS,
     NORMAL_THEN_BOLD_MIXED_BOX_CHARS,
     BOLD_BOX_CHARS,
@@ -34,3 +35,14 @@ def test_chars():
     assert box_draw_character(BOLD_BOX_CHARS, NORMAL_BOX_CHARS, top=-1, bottom=+1) == '╿'
     assert box_draw_character(DOUBLED_BOX_CHARS, NORMAL_BOX_CHARS, left=-1, bottom=+1) == '╕'
     assert box_draw_character(NORMAL_BOX_CHARS, DOUBLED_BOX_CHARS, left=-1, bottom=+1) == '╖'
+    assert box_draw_character(BOLD_BOX_CHARS, BOLD_BOX_CHARS, top=-1, right=+1) == '┗'
+    assert box_draw_character(NORMAL_BOX_CHARS, ASCII_BOX_CHARS, top=-1, bottom=+1) == '|'
+    assert box_draw_character(ASCII_BOX_CHARS, BOLD_BOX_CHARS, left=-1, right=-1) == '-'
+
+
+def test_char_covers_every_leg_combination():
+    legs = ('top', 'bottom', 'left', 'right')
+    for char_set in (NORMAL_BOX_CHARS, BOLD_BOX_CHARS, DOUBLED_BOX_CHARS, ASCII_BOX_CHARS):
+        for mask in range(1, 16):
+            used = [leg for i, leg in enumerate(legs) if mask & (1 << i)]
+            assert char_set.char(**{leg: True for leg in used}) == getattr(char_set, '_'.join(used))
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Generic, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+import collections
+from typing import Any, Deque, Generic, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 
 TItem = TypeVar('TItem')
@@ -24,10 +25,10 @@ class BucketPriorityQueue(Generic[TItem]):
     Items are dequeued in ascending priority order. Items with the same priority
     are dequeued in FIFO order.
 
-    Works by having an explicit list for each priority (from the current min
+    Works by having an explicit deque for each priority (from the current min
     priority to the current max priority). Enqueued items are placed into the
-    list corresponding to their bucket (after adding more buckets if necessary).
-    Dequeued items come from the lowest list containing items, and result in
+    deque corresponding to their bucket (after adding more buckets if necessary).
+    Dequeued items come from the lowest deque containing items, and result in
     empty buckets at the bottom end of the range being removed.
 
     Let P be the length of the priority range, and N be the number of items that
@@ -49,7 +50,7 @@ class BucketPriorityQueue(Generic[TItem]):
                 in the priority queue. Note that duplicates of an item may still
                 be enqueued, as long as they have different priorities.
         """
-        self._buckets: List[List[TItem]] = []
+        self._buckets: List[Deque[TItem]] = []
         self._offset = 0
         self._len = 0
         self._drop_set: Optional[Set[Tuple[int, TItem]]] = set() if drop_duplicate_entries else None
@@ -98,7 +99,7 @@ class BucketPriorityQueue(Generic[TItem]):
 
         # First enqueue initializes self._offset.
         if not self._buckets:
-            self._buckets.append([item])
+            self._buckets.append(collections.deque([item]))
             self._offset = priority
             self._len = 1
             return True
@@ -108,15 +109,15 @@ class BucketPriorityQueue(Generic[TItem]):
 
         # Extend bucket list backwards if needed.
         if i < 0:
-            self._buckets[:0] = [[] for _ in range(-i)]
+            self._buckets[:0] = [collections.deque() for _ in range(-i)]
             self._offset = priority
             i = 0
 
         # Extend bucket list forwards if needed.
         while i >= len(self._buckets):
-            self._buckets.append([])
+            self._buckets.append(collections.deque())
 
-        # Finish by adding item to the intended bucket's list.
+        # Finish by adding item to the intended bucket's deque.
         self._buckets[i].append(item)
         self._len += 1
         return True
@@ -141,7 +142,7 @@ class BucketPriorityQueue(Generic[TItem]):
             self._offset += 1
 
         # Pull item out of the front bucket.
-        item = self._buckets[0].pop(0)
+        item = self._buckets[0].popleft()
         priority = self._offset
         self._len -= 1
         if self._drop_set is not None:
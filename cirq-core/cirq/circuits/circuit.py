@@ -1274,9 +1274,11 @@ class AbstractCircuit(abc.ABC):
             first_annotation_row += 1
 
         moment_groups: List[Tuple[int, int]] = []
+        width = diagram.width()
         for moment in self.moments:
-            _draw_moment_in_diagram(
+            width = _draw_moment_in_diagram(
                 moment=moment,
+                x0=width,
                 use_unicode_characters=use_unicode_characters,
                 label_map=label_map,
                 out_diagram=diagram,
@@ -2292,7 +2294,7 @@ class Circuit(AbstractCircuit):
             ValueError: If the frontier given is after start.
         """
         if frontier is None:
-            frontier = defaultdict(lambda: 0)
+            frontier = defaultdict(int)
         flat_ops = tuple(ops.flatten_to_ops(operations))
         if not flat_ops:
             return frontier
@@ -2492,7 +2494,7 @@ def _pick_inserted_ops_moment_indices(
         frontier was specified as an argument, this is the same object.
     """
     if frontier is None:
-        frontier = defaultdict(lambda: 0)
+        frontier = defaultdict(int)
     moment_indices = []
     for op in operations:
         op_start = max(start, max((frontier[q] for q in op.qubits), default=0))
@@ -2531,7 +2533,9 @@ def _draw_moment_annotations(
     include_tags: bool,
     first_annotation_row: int,
     transpose: bool,
-):
+) -> bool:
+    """Draws the moment's qubitless annotations and returns whether there were any."""
+    drawn = False
     for k, annotation in enumerate(_get_moment_annotations(moment)):
         args = protocols.CircuitDiagramInfoArgs(
             known_qubits=(),
@@ -2547,11 +2551,14 @@ def _draw_moment_annotations(
         text = symbols[0] if symbols else str(annotation)
         out_diagram.force_vertical_padding_after(first_annotation_row + k - 1, 0)
         out_diagram.write(col, first_annotation_row + k, text)
+        drawn = True
+    return drawn
 
 
 def _draw_moment_in_diagram(
     *,
     moment: 'cirq.Moment',
+    x0: int,
     use_unicode_characters: bool,
     label_map: Dict['cirq.LabelEntity', int],
     out_diagram: 'cirq.TextDiagramDrawer',
@@ -2563,14 +2570,22 @@ def _draw_moment_in_diagram(
     include_tags: bool,
     first_annotation_row: int,
     transpose: bool,
-):
+) -> int:
+    """Draws the moment starting at column `x0`, the diagram's current width.
+
+    Returns:
+        The width of the diagram after drawing the moment.
+    """
     if get_circuit_diagram_info is None:
         get_circuit_diagram_info = circuit_diagram_info_protocol._op_info_with_fallback
-    x0 = out_diagram.width()
 
     non_global_ops = [op for op in moment.operations if op.qubits]
 
+    # Nothing in the diagram reaches column x0 yet, so the cells this moment
+    # fills are the only content that can block its operations.
+    occupied: Set[Tuple[int, int]] = set()
     max_x = x0
+    width = x0
     for op in non_global_ops:
         qubits = tuple(op.qubits)
         cbits = tuple(protocols.measurement_keys_touched(op) & label_map.keys())
@@ -2581,7 +2596,7 @@ def _draw_moment_in_diagram(
 
         # Find an available column.
         x = x0
-        while any(out_diagram.content_present(x, y) for y in range(y1, y2 + 1)):
+        while any((x, y) in occupied for y in range(y1, y2 + 1)):
             out_diagram.force_horizontal_padding_after(x, 0)
             x += 1
 
@@ -2597,8 +2612,10 @@ def _draw_moment_in_diagram(
         info = get_circuit_diagram_info(op, args)
 
         # Draw vertical line linking the gate's qubits.
-        if y2 > y1 and info.connected:
+        drew_line = y2 > y1 and info.connected
+        if drew_line:
             out_diagram.vertical_line(x, y1, y2, doubled=len(cbits) != 0)
+            occupied.update((x, y) for y in range(y1 + 1, y2))
 
         # Print gate qubit labels.
         symbols = info._wire_symbols_including_formatted_exponent(
@@ -2607,11 +2624,14 @@ def _draw_moment_in_diagram(
         )
         for s, q in zip(symbols, labels):
             out_diagram.write(x, label_map[q], s)
+            occupied.add((x, label_map[q]))
 
+        if drew_line or symbols:
+            width = max(width, x + 1)
         if x > max_x:
             max_x = x
 
-    _draw_moment_annotations(
+    x0_drawn = _draw_moment_annotations(
         moment=moment,
         use_unicode_characters=use_unicode_characters,
         col=x0,
@@ -2634,14 +2654,18 @@ def _draw_moment_in_diagram(
             if tags and include_tags:
                 desc = desc + f"[{', '.join(map(str, tags))}]"
             out_diagram.write(x0, y, desc)
+            x0_drawn = True
 
     if not non_global_ops:
         out_diagram.write(x0, 0, '')
+        x0_drawn = True
 
     # Group together columns belonging to the same Moment.
     if moment.operations and max_x > x0:
         moment_groups.append((x0, max_x))
 
+    return max(width, x0 + 1) if x0_drawn else width
+
 
 def _get_global_phase_and_tags_for_op(op: 'cirq.Operation') -> Tuple[Optional[complex], List[Any]]:
     if isinstance(op.gate, ops.GlobalPhaseGate):
@@ -253,10 +253,8 @@ class Moment:
         qubits = frozenset(qubits)
         if not self.operates_on(qubits):
             return self
-        return Moment(
-            operation
-            for operation in self.operations
-            if qubits.isdisjoint(frozenset(operation.qubits))
+        return Moment.from_ops(
+            *(operation for operation in self.operations if qubits.isdisjoint(operation.qubits))
         )
 
     @_compat.cached_method()
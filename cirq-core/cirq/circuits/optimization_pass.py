@@ -61,6 +61,8 @@ class PointOptimizationSummary:
     def __eq__(self, other):
         if not isinstance(other, type(self)):
             return NotImplemented
+        if self is other:
+            return True
         return (
             self.clear_span == other.clear_span
             and self.clear_qubits == other.clear_qubits
@@ -127,42 +129,49 @@ class PointOptimizer:
         """
 
     def optimize_circuit(self, circuit: 'cirq.Circuit'):
-        frontier: Dict['Qid', int] = defaultdict(lambda: 0)
+        frontier: Dict['Qid', int] = defaultdict(int)
         i = 0
         while i < len(circuit):  # Note: circuit may mutate as we go.
+            # Iterates over a snapshot of the moment's operations. Until an
+            # optimization is applied, the snapshot is known to be current.
+            mutated = False
             for op in circuit[i].operations:
                 # Don't touch stuff inserted by previous optimizations.
                 if any(frontier[q] > i for q in op.qubits):
                     continue
 
-                # Skip if an optimization removed the circuit underneath us.
-                if i >= len(circuit):
-                    continue
-                # Skip if an optimization removed the op we're considering.
-                if op not in circuit[i].operations:
-                    continue
+                if mutated:
+                    # Skip if an optimization removed the circuit underneath us.
+                    if i >= len(circuit):
+                        continue  # pragma: no cover
+                    # Skip if an optimization removed the op we're considering.
+                    if not _moment_has_operation(circuit[i], op):
+                        continue
                 opt = self.optimization_at(circuit, i, op)
                 # Skip if the optimization did nothing.
                 if opt is None:
                     continue
+                mutated = True
 
                 # Clear target area, and insert new operations.
-                circuit.clear_operations_touching(
-                    opt.clear_qubits, [e for e in range(i, i + opt.clear_span)]
-                )
+                circuit.clear_operations_touching(opt.clear_qubits, range(i, i + opt.clear_span))
                 new_operations = self.post_clean_up(cast(Tuple[ops.Operation], opt.new_operations))
 
                 flat_new_operations = tuple(ops.flatten_to_ops(new_operations))
 
-                new_qubits = set()
-                for flat_op in flat_new_operations:
-                    for q in flat_op.qubits:
-                        new_qubits.add(q)
-
-                if not new_qubits.issubset(set(opt.clear_qubits)):
+                new_qubits = {q for flat_op in flat_new_operations for q in flat_op.qubits}
+                if not new_qubits.issubset(opt.clear_qubits):
                     raise ValueError(
                         'New operations in PointOptimizer should not act on new qubits.'
                     )
 
                 circuit.insert_at_frontier(flat_new_operations, i, frontier)
             i += 1
+
+
+def _moment_has_operation(moment: 'cirq.Moment', op: 'cirq.Operation') -> bool:
+    """Determines if `op` is in `moment`, looking it up by qubit when possible."""
+    if not op.qubits:
+        return op in moment.operations
+    existing = moment.operation_at(op.qubits[0])
+    return existing is op or existing == op
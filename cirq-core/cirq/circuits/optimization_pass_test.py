@@ -53,6 +53,24 @@ def test_equality():
     )
 
 
+def test_equality_with_unhashable_operations():
+    class UnhashableGate(cirq.testing.SingleQubitGate):
+        def __eq__(self, other):
+            return isinstance(other, UnhashableGate)
+
+        __hash__ = None  # type: ignore
+
+    a = cirq.NamedQubit('a')
+    s1 = PointOptimizationSummary(
+        clear_span=1, clear_qubits=[a], new_operations=[UnhashableGate()(a)]
+    )
+    s2 = PointOptimizationSummary(
+        clear_span=1, clear_qubits=[a], new_operations=[UnhashableGate()(a)]
+    )
+    assert s1 == s2
+    assert s1 == s1
+
+
 class ReplaceWithXGates(PointOptimizer):
     """Replaces a block of operations with X gates.
 
@@ -172,6 +190,29 @@ def test_point_optimizer_raises_on_gates_changing_qubits():
         EverythingIs42().optimize_circuit(c)
 
 
+def test_point_optimizer_skips_operations_removed_by_earlier_optimizations():
+    a, b = cirq.LineQubit.range(2)
+    visited: List['cirq.Operation'] = []
+
+    class ClearBothQubits(cirq.PointOptimizer):
+        """Replaces X(a) and whatever shares its moment on b with Z(a)."""
+
+        def optimization_at(
+            self, circuit: 'cirq.Circuit', index: int, op: 'cirq.Operation'
+        ) -> Optional['cirq.PointOptimizationSummary']:
+            visited.append(op)
+            if op != cirq.X(a):
+                return None
+            return cirq.PointOptimizationSummary(
+                clear_span=1, clear_qubits=[a, b], new_operations=cirq.Z(a)
+            )
+
+    c = cirq.Circuit(cirq.Moment(cirq.X(a), cirq.Y(b), cirq.global_phase_operation(-1)))
+    ClearBothQubits().optimize_circuit(c)
+    assert visited == [cirq.X(a), cirq.global_phase_operation(-1)]
+    assert c == cirq.Circuit(cirq.Moment(cirq.Z(a), cirq.global_phase_operation(-1)))
+
+
 def test_repr():
     assert (
         repr(cirq.PointOptimizationSummary(clear_span=0, clear_qubits=[], new_operations=[]))
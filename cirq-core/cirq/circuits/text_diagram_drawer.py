@@ -129,11 +129,16 @@ class TextDiagramDrawer:
             transposed_text: Optional text to write instead, if the text
                 diagram is transposed.
         """
-        entry = self.entries.get((x, y), _DiagramText('', ''))
-        self.entries[(x, y)] = _DiagramText(
-            entry.text + text,
-            entry.transposed_text + (transposed_text if transposed_text else text),
-        )
+        key = (x, y)
+        if not transposed_text:
+            transposed_text = text
+        entry = self.entries.get(key)
+        if entry is None:
+            self.entries[key] = _DiagramText(text, transposed_text)
+        else:
+            self.entries[key] = _DiagramText(
+                entry.text + text, entry.transposed_text + transposed_text
+            )
 
     def content_present(self, x: int, y: int) -> bool:
         """Determines if a line or printed text is at the given location."""
@@ -179,7 +184,8 @@ class TextDiagramDrawer:
         doubled: bool = False,
     ) -> None:
         """Adds a line from (x, y1) to (x, y2)."""
-        y1, y2 = sorted([y1, y2])
+        if y1 > y2:
+            y1, y2 = y2, y1
         self.vertical_lines.append(_VerticalLine(x, y1, y2, emphasize, doubled))
 
     def horizontal_line(
@@ -191,7 +197,8 @@ class TextDiagramDrawer:
         doubled: bool = False,
     ) -> None:
         """Adds a line from (x1, y) to (x2, y)."""
-        x1, x2 = sorted([x1, x2])
+        if x1 > x2:
+            x1, x2 = x2, x1
         self.horizontal_lines.append(_HorizontalLine(y, x1, x2, emphasize, doubled))
 
     def transpose(self) -> 'cirq.TextDiagramDrawer':
@@ -208,24 +215,20 @@ class TextDiagramDrawer:
 
     def width(self) -> int:
         """Determines how many entry columns are in the diagram."""
-        max_x = -1.0
-        for x, _ in self.entries.keys():
-            max_x = max(max_x, x)
-        for v in self.vertical_lines:
-            max_x = max(max_x, v.x)
-        for h in self.horizontal_lines:
-            max_x = max(max_x, h.x1, h.x2)
+        max_x = max(
+            max((x for x, _ in self.entries), default=-1),
+            max((x for x, _, _, _, _ in self.vertical_lines), default=-1),
+            max((max(x1, x2) for _, x1, x2, _, _ in self.horizontal_lines), default=-1),
+        )
         return 1 + int(max_x)
 
     def height(self) -> int:
         """Determines how many entry rows are in the diagram."""
-        max_y = -1.0
-        for _, y in self.entries.keys():
-            max_y = max(max_y, y)
-        for h in self.horizontal_lines:
-            max_y = max(max_y, h.y)
-        for v in self.vertical_lines:
-            max_y = max(max_y, v.y1, v.y2)
+        max_y = max(
+            max((y for _, y in self.entries), default=-1),
+            max((y for y, _, _, _, _ in self.horizontal_lines), default=-1),
+            max((max(y1, y2) for _, y1, y2, _, _ in self.vertical_lines), default=-1),
+        )
         return 1 + int(max_y)
 
     def force_horizontal_padding_after(self, index: int, padding: Union[int, float]) -> None:
@@ -236,57 +239,75 @@ class TextDiagramDrawer:
         """Change the padding after the given row."""
         self.vertical_padding[index] = padding
 
-    def _transform_coordinates(
-        self,
-        func: Callable[
-            [Union[int, float], Union[int, float]], Tuple[Union[int, float], Union[int, float]]
-        ],
-    ) -> None:
-        """Helper method to transformer either row or column coordinates."""
-
-        def func_x(x: Union[int, float]) -> Union[int, float]:
-            return func(x, 0)[0]
-
-        def func_y(y: Union[int, float]) -> Union[int, float]:
-            return func(0, y)[1]
-
+    def insert_empty_columns(self, x: int, amount: int = 1) -> None:
+        """Insert a number of columns after the given column."""
+        # Lines entirely before the insertion point are reused as is.
         self.entries = {
-            cast(Tuple[int, int], func(int(x), int(y))): v for (x, y), v in self.entries.items()
+            (column + amount if column >= x else column, row): v
+            for (column, row), v in self.entries.items()
         }
         self.vertical_lines = [
-            _VerticalLine(func_x(x), func_y(y1), func_y(y2), emph, doubled)
-            for x, y1, y2, emph, doubled in self.vertical_lines
+            (
+                line
+                if line.x < x
+                else _VerticalLine(line.x + amount, line.y1, line.y2, line.emphasize, line.doubled)
+            )
+            for line in self.vertical_lines
         ]
         self.horizontal_lines = [
-            _HorizontalLine(func_y(y), func_x(x1), func_x(x2), emph, doubled)
-            for y, x1, x2, emph, doubled in self.horizontal_lines
+            (
+                line
+                if line.x1 < x and line.x2 < x
+                else _HorizontalLine(
+                    line.y,
+                    line.x1 + amount if line.x1 >= x else line.x1,
+                    line.x2 + amount if line.x2 >= x else line.x2,
+                    line.emphasize,
+                    line.doubled,
+                )
+            )
+            for line in self.horizontal_lines
         ]
         self.horizontal_padding = {
-            int(func_x(int(x))): padding for x, padding in self.horizontal_padding.items()
+            column + amount if column >= x else column: padding
+            for column, padding in self.horizontal_padding.items()
         }
-        self.vertical_padding = {
-            int(func_y(int(y))): padding for y, padding in self.vertical_padding.items()
-        }
-
-    def insert_empty_columns(self, x: int, amount: int = 1) -> None:
-        """Insert a number of columns after the given column."""
-
-        def transform_columns(
-            column: Union[int, float], row: Union[int, float]
-        ) -> Tuple[Union[int, float], Union[int, float]]:
-            return column + (amount if column >= x else 0), row
-
-        self._transform_coordinates(transform_columns)
 
     def insert_empty_rows(self, y: int, amount: int = 1) -> None:
         """Insert a number of rows after the given row."""
-
-        def transform_rows(
-            column: Union[int, float], row: Union[int, float]
-        ) -> Tuple[Union[int, float], Union[int, float]]:
-            return column, row + (amount if row >= y else 0)
-
-        self._transform_coordinates(transform_rows)
+        # Lines entirely before the insertion point are reused as is.
+        self.entries = {
+            (column, row + amount if row >= y else row): v
+            for (column, row), v in self.entries.items()
+        }
+        self.vertical_lines = [
+            (
+                line
+                if line.y1 < y and line.y2 < y
+                else _VerticalLine(
+                    line.x,
+                    line.y1 + amount if line.y1 >= y else line.y1,
+                    line.y2 + amount if line.y2 >= y else line.y2,
+                    line.emphasize,
+                    line.doubled,
+                )
+            )
+            for line in self.vertical_lines
+        ]
+        self.horizontal_lines = [
+            (
+                line
+                if line.y < y
+                else _HorizontalLine(
+                    line.y + amount, line.x1, line.x2, line.emphasize, line.doubled
+                )
+            )
+            for line in self.horizontal_lines
+        ]
+        self.vertical_padding = {
+            row + amount if row >= y else row: padding
+            for row, padding in self.vertical_padding.items()
+        }
 
     def render(
         self,
@@ -297,10 +318,12 @@ class TextDiagramDrawer:
     ) -> str:
         """Outputs text containing the diagram."""
 
-        block_diagram = BlockDiagramDrawer()
-
         w = self.width()
         h = self.height()
+        if not w or not h:
+            return ''
+
+        block_diagram = BlockDiagramDrawer()
 
         # Communicate padding into block diagram.
         for x in range(w - 1):
@@ -365,12 +388,33 @@ class TextDiagramDrawer:
             horizontal_padding=self.horizontal_padding,
         )
 
+    def _translate_from(self, source: 'cirq.TextDiagramDrawer', dx: int, dy: int) -> None:
+        self.entries = {(x + dx, y + dy): v for (x, y), v in source.entries.items()}
+        self.vertical_lines = [
+            _VerticalLine(x + dx, y1 + dy, y2 + dy, emph, doubled)
+            for x, y1, y2, emph, doubled in source.vertical_lines
+        ]
+        self.horizontal_lines = [
+            _HorizontalLine(y + dy, x1 + dx, x2 + dx, emph, doubled)
+            for y, x1, x2, emph, doubled in source.horizontal_lines
+        ]
+        self.horizontal_padding = {
+            x + dx: padding for x, padding in source.horizontal_padding.items()
+        }
+        self.vertical_padding = {y + dy: padding for y, padding in source.vertical_padding.items()}
+
     def shift(self, dx: int = 0, dy: int = 0) -> 'cirq.TextDiagramDrawer':
-        self._transform_coordinates(lambda x, y: (x + dx, y + dy))
+        if dx or dy:
+            self._translate_from(self, dx, dy)
         return self
 
     def shifted(self, dx: int = 0, dy: int = 0) -> 'cirq.TextDiagramDrawer':
-        return self.copy().shift(dx, dy)
+        if not dx and not dy:
+            return self.copy()
+        # Translating builds new containers anyway, so skip copying them first.
+        shifted = self.__class__()
+        shifted._translate_from(self, dx, dy)
+        return shifted
 
     def superimpose(self, other: 'cirq.TextDiagramDrawer') -> 'cirq.TextDiagramDrawer':
         self.entries.update(other.entries)
@@ -479,7 +523,10 @@ def _same_element_or_throw_error(elements: Sequence[Any]):
         The element when given a sequence containing only multiple copies of a
         single element. None if elements is empty.
     """
-    unique_elements = set(elements)
-    if len(unique_elements) > 1:
-        raise ValueError(f'len(set({elements})) > 1')
-    return unique_elements.pop() if elements else None
+    if not elements:
+        return None
+    first = elements[0]
+    for element in elements:
+        if element != first:
+            raise ValueError(f'len(set({elements})) > 1')
+    return first
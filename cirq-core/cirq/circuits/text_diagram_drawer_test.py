@@ -27,6 +27,7 @@ from cirq.circuits.text_diagram_drawer import (
     _HorizontalLine,
     _VerticalLine,
     _DiagramText,
+    _same_element_or_throw_error,
     pick_charset,
 )
 import cirq.testing as ct
@@ -56,6 +57,15 @@ def assert_has_rendering(actual: TextDiagramDrawer, desired: str, **kwargs) -> N
     )
 
 
+def test_render_empty():
+    assert TextDiagramDrawer().render() == ''
+
+    d = TextDiagramDrawer()
+    d.force_horizontal_padding_after(0, 3)
+    d.force_vertical_padding_after(0, 2)
+    assert d.render() == ''
+
+
 def test_draw_entries_and_lines_with_options():
     d = TextDiagramDrawer()
     d.write(0, 0, '!')
@@ -178,6 +188,89 @@ def test_line_fails_when_not_aligned():
         d.grid_line(1, 2, 3, 4)
 
 
+def test_write_appends_text_and_transposed_text():
+    d = TextDiagramDrawer()
+    d.write(0, 0, 'a')
+    d.write(0, 0, 'b', 'B')
+    d.write(1, 0, 'c', '')
+    assert d.entries == {(0, 0): _DiagramText('ab', 'aB'), (1, 0): _DiagramText('c', 'c')}
+
+
+def test_content_present():
+    d = TextDiagramDrawer()
+    assert not d.content_present(0, 0)
+
+    d.write(0, 0, 'A')
+    assert d.content_present(0, 0)
+
+    d.vertical_line(1, 3, 0)
+    assert d.content_present(1, 1)
+    assert d.content_present(1, 2)
+    assert not d.content_present(1, 0)
+    assert not d.content_present(1, 3)
+    assert not d.content_present(2, 1)
+
+    d.horizontal_line(2, 4, 7)
+    assert d.content_present(5, 2)
+    assert not d.content_present(4, 2)
+    assert not d.content_present(5, 3)
+
+    d.vertical_line(1, 5, 7)
+    assert d.content_present(1, 6)
+
+    # Lines moved by coordinate transforms are found at their new location.
+    d.insert_empty_columns(0)
+    assert not d.content_present(1, 1)
+    assert d.content_present(2, 1)
+    assert d.content_present(6, 2)
+
+    t = d.transpose()
+    assert t.content_present(1, 2)
+    assert t.content_present(2, 6)
+    assert not t.content_present(2, 1)
+
+    # Lines replaced directly in the public list are found.
+    d.vertical_lines[0] = _VerticalLine(7, 0, 9, False, False)
+    assert d.content_present(7, 5)
+
+
+def test_insert_empty_columns_and_rows():
+    d = TextDiagramDrawer(
+        entries={(0, 0): _DiagramText('a', 'A'), (2, 3): _DiagramText('b', 'B')},
+        vertical_lines=[_VerticalLine(2, 0, 3, True, False), _VerticalLine(0, 2, 0, False, False)],
+        horizontal_lines=[
+            _HorizontalLine(1, 0, 2, False, True),
+            _HorizontalLine(0, 2, 0, False, False),
+        ],
+        horizontal_padding={0: 1, 2: 3},
+        vertical_padding={1: 2, 3: 4},
+    )
+
+    d.insert_empty_columns(1, 2)
+    assert d == TextDiagramDrawer(
+        entries={(0, 0): _DiagramText('a', 'A'), (4, 3): _DiagramText('b', 'B')},
+        vertical_lines=[_VerticalLine(4, 0, 3, True, False), _VerticalLine(0, 2, 0, False, False)],
+        horizontal_lines=[
+            _HorizontalLine(1, 0, 4, False, True),
+            _HorizontalLine(0, 4, 0, False, False),
+        ],
+        horizontal_padding={0: 1, 4: 3},
+        vertical_padding={1: 2, 3: 4},
+    )
+
+    d.insert_empty_rows(1)
+    assert d == TextDiagramDrawer(
+        entries={(0, 0): _DiagramText('a', 'A'), (4, 4): _DiagramText('b', 'B')},
+        vertical_lines=[_VerticalLine(4, 0, 4, True, False), _VerticalLine(0, 3, 0, False, False)],
+        horizontal_lines=[
+            _HorizontalLine(2, 0, 4, False, True),
+            _HorizontalLine(0, 4, 0, False, False),
+        ],
+        horizontal_padding={0: 1, 4: 3},
+        vertical_padding={2: 2, 4: 4},
+    )
+
+
 def test_multiline_entries():
     d = TextDiagramDrawer()
     d.write(0, 0, 'hello\nthere')
@@ -263,6 +356,86 @@ def test_drawer_copy():
     assert copy_drawer != orig_drawer
 
 
+def test_drawer_shift():
+    d = TextDiagramDrawer(
+        entries={(0, 0): _DiagramText('entry', 'transposed')},
+        vertical_lines=[_VerticalLine(1, 0, 2, True, False)],
+        horizontal_lines=[_HorizontalLine(2, 0, 1, False, True)],
+        horizontal_padding={0: 3},
+        vertical_padding={1: 2},
+    )
+    expected = TextDiagramDrawer(
+        entries={(2, 1): _DiagramText('entry', 'transposed')},
+        vertical_lines=[_VerticalLine(3, 1, 3, True, False)],
+        horizontal_lines=[_HorizontalLine(3, 2, 3, False, True)],
+        horizontal_padding={2: 3},
+        vertical_padding={2: 2},
+    )
+
+    assert d.shifted() == d
+    assert d.shifted() is not d
+    assert d.shifted(dx=2, dy=1) == expected
+    assert d != expected
+
+    assert d.shift(dx=2, dy=1) is d
+    assert d == expected
+
+
+def test_line_endpoints_are_sorted():
+    d = TextDiagramDrawer()
+    d.vertical_line(0, 3, 1)
+    d.horizontal_line(2, 4, 0, emphasize=True)
+    assert d.vertical_lines == [_VerticalLine(0, 1, 3, False, False)]
+    assert d.horizontal_lines == [_HorizontalLine(2, 0, 4, True, False)]
+
+
+def test_width_and_height():
+    d = TextDiagramDrawer()
+    assert (d.width(), d.height()) == (0, 0)
+
+    d.write(2, 1, 'a')
+    assert (d.width(), d.height()) == (3, 2)
+    d.write(0, 0, 'b')
+    assert (d.width(), d.height()) == (3, 2)
+    d.vertical_line(4, 0, 5)
+    assert (d.width(), d.height()) == (5, 6)
+    d.horizontal_line(7, 1, 6)
+    assert (d.width(), d.height()) == (7, 8)
+
+    d.vertical_lines.pop()
+    d.horizontal_lines.clear()
+    assert (d.width(), d.height()) == (3, 2)
+    del d.entries[2, 1]
+    assert (d.width(), d.height()) == (1, 1)
+
+    d.insert_empty_columns(0, 2)
+    d.insert_empty_rows(0)
+    assert (d.width(), d.height()) == (3, 2)
+    d.shift(dx=1)
+    assert (d.width(), d.height()) == (4, 2)
+
+    # Direct edits to the public containers are reflected.
+    d = TextDiagramDrawer()
+    d.write(5, 5, 'a')
+    d.vertical_line(0, 0, 1)
+    assert (d.width(), d.height()) == (6, 6)
+    del d.entries[5, 5]
+    d.entries[0, 0] = _DiagramText('b', 'b')
+    assert (d.width(), d.height()) == (1, 2)
+    d.vertical_lines[0] = _VerticalLine(7, 0, 9, False, False)
+    assert (d.width(), d.height()) == (8, 10)
+
+
+def test_same_element_or_throw_error():
+    assert _same_element_or_throw_error(()) is None
+    assert _same_element_or_throw_error((None, None)) is None
+    assert _same_element_or_throw_error((2, 2, 2)) == 2
+    with pytest.raises(ValueError):
+        _same_element_or_throw_error((2, 2, None))
+    with pytest.raises(ValueError):
+        _same_element_or_throw_error((1, 2))
+
+
 def test_drawer_stack():
     d = TextDiagramDrawer()
     d.write(0, 0, 'A')
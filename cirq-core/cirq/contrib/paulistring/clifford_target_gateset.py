@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Union, Type, cast, TYPE_CHECKING
+import functools
+from typing import List, Optional, Tuple, Union, Type, cast, TYPE_CHECKING
 from enum import Enum
 import numpy as np
 
@@ -23,6 +24,33 @@ if TYPE_CHECKING:
     import cirq
 
 
+@functools.cache
+def _quarter_turns_clifford(pauli: 'cirq.Pauli', quarter_turns: int) -> ops.SingleQubitCliffordGate:
+    # Sharing instances lets the per-instance merged_with cache hit across calls.
+    return ops.SingleQubitCliffordGate.from_quarter_turns(pauli, quarter_turns)
+
+
+_POW_GATE_TYPES_AND_PAULIS: Tuple[Tuple[Type[ops.EigenGate], 'cirq.Pauli'], ...] = (
+    (ops.XPowGate, ops.X),
+    (ops.YPowGate, ops.Y),
+    (ops.ZPowGate, ops.Z),
+)
+
+
+def _pauli_power_to_clifford(gate: Optional['cirq.Gate']) -> Optional[ops.SingleQubitCliffordGate]:
+    """Returns the Clifford equal to an X/Y/Z power by a non-zero multiple of 1/2, if it is one."""
+    for gate_type, pauli in _POW_GATE_TYPES_AND_PAULIS:
+        if isinstance(gate, gate_type):
+            break
+    else:
+        return None
+    exponent = cast(ops.EigenGate, gate).exponent
+    if protocols.is_parameterized(exponent) or not linalg.all_near_zero_mod(exponent, 0.5):
+        return None
+    quarter_turns = round(exponent * 2) % 4
+    return _quarter_turns_clifford(pauli, quarter_turns) if quarter_turns else None
+
+
 def _matrix_to_clifford_op(
     mat: np.ndarray, qubit: 'cirq.Qid', *, atol: float
 ) -> Union[ops.Operation, NotImplementedType]:
@@ -32,10 +60,7 @@ def _matrix_to_clifford_op(
         if linalg.all_near_zero_mod(half_turns, 0.5):
             quarter_turns = round(half_turns * 2) % 4
             # quarter_turns will always be 1-sqrt(pauli) / 2-pauli / 3-sqrt(pauli) ** -1.
-            clifford_gate = clifford_gate.merged_with(
-                ops.SingleQubitCliffordGate.from_pauli(pauli, sqrt=bool(quarter_turns % 2))
-                ** (1 - 2 * int(quarter_turns == 3))
-            )
+            clifford_gate = clifford_gate.merged_with(_quarter_turns_clifford(pauli, quarter_turns))
         else:
             return NotImplemented
     return clifford_gate(qubit)
@@ -48,9 +73,7 @@ def _matrix_to_pauli_string_phasors(
     out_ops: List[ops.GateOperation] = []
     for pauli, half_turns in rotations:
         if keep_clifford and linalg.all_near_zero_mod(half_turns, 0.5):
-            cliff_gate = ops.SingleQubitCliffordGate.from_quarter_turns(
-                pauli, round(half_turns * 2)
-            )
+            cliff_gate = _quarter_turns_clifford(pauli, round(half_turns * 2) % 4)
             if out_ops and not isinstance(out_ops[-1], ops.PauliStringPhasor):
                 gate = cast(ops.SingleQubitCliffordGate, out_ops[-1].gate)
                 out_ops[-1] = gate.merged_with(cliff_gate)(qubit)
@@ -110,9 +133,14 @@ class CliffordTargetGateset(transformers.TwoQubitCompilationTargetGateset):
     def _decompose_single_qubit_operation(
         self, op: 'cirq.Operation', _
     ) -> Union[NotImplementedType, 'cirq.OP_TREE']:
-        if not protocols.has_unitary(op):
+        if self.single_qubit_target != self.SingleQubitTarget.PAULI_STRING_PHASORS:
+            # Skip building and decomposing the unitary of common Clifford Pauli powers.
+            clifford_gate = _pauli_power_to_clifford(op.gate)
+            if clifford_gate is not None:
+                return clifford_gate(op.qubits[0])
+        mat = protocols.unitary(op, None)
+        if mat is None:
             return NotImplemented
-        mat = protocols.unitary(op)
         keep_clifford = (
             self.single_qubit_target == self.SingleQubitTarget.PAULI_STRING_PHASORS_AND_CLIFFORDS
         )
@@ -127,14 +155,11 @@ class CliffordTargetGateset(transformers.TwoQubitCompilationTargetGateset):
     def _decompose_two_qubit_operation(
         self, op: 'cirq.Operation', _
     ) -> Union[NotImplementedType, 'cirq.OP_TREE']:
-        if not protocols.has_unitary(op):
+        mat = protocols.unitary(op, None)
+        if mat is None:
             return NotImplemented
         return transformers.two_qubit_matrix_to_cz_operations(
-            op.qubits[0],
-            op.qubits[1],
-            protocols.unitary(op),
-            allow_partial_czs=False,
-            atol=self.atol,
+            op.qubits[0], op.qubits[1], mat, allow_partial_czs=False, atol=self.atol
         )
 
     @property
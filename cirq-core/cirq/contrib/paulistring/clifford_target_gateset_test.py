@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+
+import numpy as np
 import pytest
 import sympy
 
@@ -232,6 +235,32 @@ def test_convert_to_single_qubit_cliffords():
     )
 
 
+@pytest.mark.parametrize(
+    'target',
+    [
+        CliffordTargetGateset.SingleQubitTarget.SINGLE_QUBIT_CLIFFORDS,
+        CliffordTargetGateset.SingleQubitTarget.PAULI_STRING_PHASORS_AND_CLIFFORDS,
+    ],
+)
+def test_pauli_powers_decompose_like_their_unitary(target):
+    q = cirq.LineQubit(0)
+    gateset = CliffordTargetGateset(single_qubit_target=target)
+    gates = [
+        gate_type(exponent=exponent, global_shift=global_shift)
+        for gate_type, global_shift, exponent in itertools.product(
+            [cirq.XPowGate, cirq.YPowGate, cirq.ZPowGate], [0, -0.5], [0.5, 1, -0.5, 1.5, 2.5, -3]
+        )
+    ]
+    gates += [cirq.X, cirq.Y, cirq.Z, cirq.rx(np.pi / 2), cirq.ry(-np.pi), cirq.rz(3 * np.pi / 2)]
+    for gate in gates:
+        op = gate.on(q)
+        expected = gateset._decompose_single_qubit_operation(
+            cirq.MatrixGate(cirq.unitary(op)).on(q), -1
+        )
+        actual = gateset._decompose_single_qubit_operation(op, -1)
+        assert cirq.Circuit(actual) == cirq.Circuit(expected)
+
+
 def test_convert_to_single_qubit_cliffords_ignores_non_clifford():
     q0 = cirq.LineQubit(0)
     c_orig = cirq.Circuit(cirq.Z(q0) ** 0.25)
@@ -9,9 +9,9 @@ import cirq.contrib.quimb as ccq
 
 def _get_circuit(width, height, rs, p=2):
     graph = nx.grid_2d_graph(width, height)
-    nx.set_edge_attributes(
-        graph, name='weight', values={e: np.round(rs.uniform(), 2) for e in graph.edges}
-    )
+    edges = list(graph.edges)
+    weights = np.round(rs.uniform(size=len(edges)), 2).tolist()
+    nx.set_edge_attributes(graph, name='weight', values=dict(zip(edges, weights)))
     qubits = [cirq.GridQubit(*n) for n in graph]
     circuit = cirq.Circuit(
         cirq.H.on_each(qubits),
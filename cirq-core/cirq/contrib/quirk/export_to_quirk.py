@@ -73,8 +73,10 @@ def circuit_to_quirk_url(
     Returns:
 
     """
-    circuit = circuit.copy()
-    linearize_circuit_qubits(circuit)
+    qubits = circuit.all_qubits()
+    if qubits != set(devices.LineQubit.range(len(qubits))):
+        circuit = circuit.copy()
+        linearize_circuit_qubits(circuit)
 
     cols: List[List[Any]] = []
     for moment in circuit:
@@ -88,9 +90,9 @@ def circuit_to_quirk_url(
         if can_merges:
             merged_col = [1] * max(len(e) for e in can_merges)
             for col in can_merges:
-                for i in range(len(col)):
-                    if col[i] != 1:
-                        merged_col[i] = col[i]
+                for i, key in enumerate(col):
+                    if key != 1:
+                        merged_col[i] = key
             cols.append(merged_col)
 
     circuit_json = json.JSONEncoder(
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
 import sympy
 
 import cirq
 from cirq.contrib.quirk.export_to_quirk import circuit_to_quirk_url
+from cirq.contrib.quirk.quirk_gate import same_half_turns, single_qubit_matrix_gate
 
 
 def assert_links_to(circuit: cirq.Circuit, expected: str, **kwargs):
@@ -44,6 +46,28 @@ def test_x_z_same_col():
     )
 
 
+def test_line_qubits_linearized():
+    a, b = cirq.LineQubit(2), cirq.LineQubit(5)
+    circuit = cirq.Circuit(cirq.X(a), cirq.Z(b))
+    assert_links_to(
+        circuit,
+        """
+        http://algassert.com/quirk#circuit={"cols":[["X","Z"]]}
+    """,
+        escape_url=False,
+    )
+    assert circuit.all_qubits() == {a, b}
+
+    circuit = cirq.Circuit(cirq.X(cirq.LineQubit(1)), cirq.Z(cirq.LineQubit(0)))
+    assert_links_to(
+        circuit,
+        """
+        http://algassert.com/quirk#circuit={"cols":[["Z","X"]]}
+    """,
+        escape_url=False,
+    )
+
+
 def test_x_cnot_split_cols():
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
@@ -279,6 +303,19 @@ def test_unrecognized_single_qubit_gate_with_matrix():
     )
 
 
+def test_single_qubit_matrix_gate_cleanup():
+    op = single_qubit_matrix_gate(np.array([[1, 0.5j], [-2.5, 0.25 + 1j]]))
+    assert op is not None
+    assert op.keys == ({'id': '?', 'matrix': '{{1,-2.5},{0+0.5i,0.25+1.0i}}'},)
+    assert single_qubit_matrix_gate(np.eye(4)) is None
+
+
+def test_same_half_turns():
+    assert same_half_turns(0.5, 2.5)
+    assert same_half_turns(-1, 1.00001)
+    assert not same_half_turns(0.5, -0.5)
+
+
 def test_unknown_gate():
     class UnknownGate(cirq.testing.SingleQubitGate):
         pass
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 from typing import Any, Callable, cast, Dict, Optional, Union
 
 import numpy as np
@@ -79,6 +80,9 @@ def _val_to_quirk_formula(t: Union[float, sympy.Basic]) -> str:
     return f'{float(t):.4f}'
 
 
+_QUARTER_TURNS_TO_EXPONENT_KEY = {4: '', -4: '', 2: '^½', -2: '^-½', 1: '^¼', -1: '^-¼'}
+
+
 def angle_to_exponent_key(t: Union[float, sympy.Basic]) -> Optional[str]:
     if isinstance(t, sympy.Basic):
         if t == sympy.Symbol('t'):
@@ -89,48 +93,35 @@ def angle_to_exponent_key(t: Union[float, sympy.Basic]) -> Optional[str]:
 
         return None
 
-    if same_half_turns(t, 1):
-        return ''
-
-    if same_half_turns(t, 0.5):
-        return '^½'
+    # Snap to the nearest quarter turn, then look up its key.
+    d = (t + 1) % 2 - 1
+    quarter_turns = round(d * 4)
+    if abs(d - quarter_turns / 4) >= 0.0001:
+        return None
+    return _QUARTER_TURNS_TO_EXPONENT_KEY.get(quarter_turns)
 
-    if same_half_turns(t, -0.5):
-        return '^-½'
 
-    if same_half_turns(t, 0.25):
-        return '^¼'
+# Drops '+' before negative parts, zero imaginary parts, and '.0' suffixes on integers.
+_MATRIX_REPR_CLEANUP = re.compile(r'\+-|\+0\.0i|\.0(?=[,}+-])')
 
-    if same_half_turns(t, -0.25):
-        return '^-¼'
 
-    return None
+def _clean_matrix_repr_match(match: 're.Match') -> str:
+    return '-' if match.group() == '+-' else ''
 
 
 def single_qubit_matrix_gate(matrix: Optional[np.ndarray]) -> Optional[QuirkOp]:
     if matrix is None or matrix.shape[0] != 2:
         return None
 
-    # pylint: disable=consider-using-f-string
     matrix = matrix.round(6)
-    matrix_repr = '{{%s+%si,%s+%si},{%s+%si,%s+%si}}' % (
-        np.real(matrix[0, 0]),
-        np.imag(matrix[0, 0]),
-        np.real(matrix[1, 0]),
-        np.imag(matrix[1, 0]),
-        np.real(matrix[0, 1]),
-        np.imag(matrix[0, 1]),
-        np.real(matrix[1, 1]),
-        np.imag(matrix[1, 1]),
+    real, imag = np.real(matrix), np.imag(matrix)
+    matrix_repr = (
+        f'{{{{{real[0, 0]!s}+{imag[0, 0]!s}i,{real[1, 0]!s}+{imag[1, 0]!s}i}},'
+        f'{{{real[0, 1]!s}+{imag[0, 1]!s}i,{real[1, 1]!s}+{imag[1, 1]!s}i}}}}'
     )
 
     # Clean up.
-    matrix_repr = matrix_repr.replace('+-', '-')
-    matrix_repr = matrix_repr.replace('+0.0i', '')
-    matrix_repr = matrix_repr.replace('.0,', ',')
-    matrix_repr = matrix_repr.replace('.0}', '}')
-    matrix_repr = matrix_repr.replace('.0+', '+')
-    matrix_repr = matrix_repr.replace('.0-', '-')
+    matrix_repr = _MATRIX_REPR_CLEANUP.sub(_clean_matrix_repr_match, matrix_repr)
 
     return QuirkOp({'id': '?', 'matrix': matrix_repr})
 
@@ -349,11 +349,11 @@ class TensoredConfusionMatrices:
         """
 
         # first, get all of the confusion matrices
+        measure_qubits_index = {qs: i for i, qs in enumerate(self.measure_qubits)}
         cm_all = []
         for qubit in qubits:
-            try:
-                idx = self.measure_qubits.index((qubit,))
-            except:  # pragma: no cover
+            idx = measure_qubits_index.get((qubit,))
+            if idx is None:  # pragma: no cover
                 raise NotImplementedError(  # pragma: no cover
                     "The response matrix must be a tensor product of single-qu"  # pragma: no cover
                     + f"bit response matrices, including that of qubit {qubit}."  # pragma: no cover
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 import cirq
-from cirq import ops, linalg, value
+from cirq import _compat, ops, value
 from cirq.interop.quirk.cells.cell import Cell, CellMaker
 
 
@@ -127,15 +128,20 @@ class QuirkInputRotationOperation(ops.Operation):
             self.exponent_sign,
         )
 
-    def _circuit_diagram_info_(self, args: 'cirq.CircuitDiagramInfoArgs'):
+    @_compat.cached_method
+    def _diagram_symbols(self) -> Tuple[Tuple[str, ...], int]:
         sub_result = cirq.circuit_diagram_info(self.base_operation)
+        symbols = sub_result.wire_symbols + tuple(f'A{i}' for i in range(len(self.register)))
+        return symbols, sub_result.exponent_qubit_index or 0
+
+    def _circuit_diagram_info_(self, args: 'cirq.CircuitDiagramInfoArgs'):
+        # A fresh info is returned each call since callers may modify it.
+        symbols, exponent_qubit_index = self._diagram_symbols()
         sign_char = '-' if self.exponent_sign == -1 else ''
-        symbols = list(sub_result.wire_symbols)
-        symbols.extend(f'A{i}' for i in range(len(self.register)))
         return cirq.CircuitDiagramInfo(
-            tuple(symbols),
+            symbols,
             exponent=f'({sign_char}A/2^{len(self.register)})',
-            exponent_qubit_index=sub_result.exponent_qubit_index or 0,
+            exponent_qubit_index=exponent_qubit_index,
             auto_exponent_parens=False,
         )
 
@@ -144,24 +150,24 @@ class QuirkInputRotationOperation(ops.Operation):
 
     def _apply_unitary_(self, args: 'cirq.ApplyUnitaryArgs'):
         transposed_args = args.with_axes_transposed_to_start()
-
-        target_axes = transposed_args.axes[: len(self.base_operation.qubits)]
-        control_axes = transposed_args.axes[len(self.base_operation.qubits) :]
-        control_max = np.prod([q.dimension for q in self.register], dtype=np.int64).item()
-
-        for i in range(control_max):
-            assert isinstance(self.base_operation, cirq.GateOperation)
-            operation = self.base_operation ** (self.exponent_sign * i / control_max)
-            control_index = linalg.slice_for_qubits_equal_to(control_axes, big_endian_qureg_value=i)
-            sub_args = cirq.ApplyUnitaryArgs(
-                transposed_args.target_tensor[control_index],
-                transposed_args.available_buffer[control_index],
-                target_axes,
-            )
-            sub_result = cirq.apply_unitary(operation, sub_args)
-
-            if sub_result is not sub_args.target_tensor:
-                sub_args.target_tensor[...] = sub_result
+        target = transposed_args.target_tensor
+
+        num_targets = len(self.base_operation.qubits)
+        target_shape = target.shape[:num_targets]
+        control_max = math.prod(q.dimension for q in self.register)
+        target_size = math.prod(target_shape)
+
+        # One unitary per input value, applied to the matching control slice in a single einsum.
+        assert isinstance(self.base_operation, cirq.GateOperation)
+        unitaries = np.array(
+            [
+                cirq.unitary(self.base_operation ** (self.exponent_sign * i / control_max))
+                for i in range(control_max)
+            ]
+        )
+        state = target.reshape((target_size, control_max, -1))
+        result = np.einsum('cjk,kcr->jcr', unitaries, state)
+        target[...] = result.reshape(target.shape)
 
         return args.target_tensor
 
@@ -143,6 +143,23 @@ def test_input_rotation_with_qubits():
     )
 
 
+def test_input_rotation_tagged_diagram_is_stable():
+    a, b, c = cirq.LineQubit.range(3)
+    op = cirq.interop.quirk.QuirkInputRotationOperation(
+        identifier='test', register=[b, c], base_operation=cirq.Z(a), exponent_sign=1
+    ).with_tags('t')
+    circuit = cirq.Circuit(op)
+    expected = """
+0: ───Z[t]^(A/2^2)───
+      │
+1: ───A0─────────────
+      │
+2: ───A1─────────────
+"""
+    cirq.testing.assert_has_diagram(circuit, expected)
+    cirq.testing.assert_has_diagram(circuit, expected)
+
+
 def test_input_rotation_cell_with_qubits():
     a, b, c, d, e = cirq.LineQubit.range(5)
     x, y, z, t, w = cirq.LineQubit.range(10, 15)
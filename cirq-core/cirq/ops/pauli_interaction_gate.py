@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from typing import Any, Dict, Iterator, List, Sequence, TYPE_CHECKING, Tuple
 
 import numpy as np
@@ -31,6 +32,27 @@ PAULI_EIGEN_MAP: Dict[pauli_gates.Pauli, Tuple[np.ndarray, np.ndarray]] = {
 }
 
 
+@functools.cache
+def _eigen_projectors(
+    pauli0: pauli_gates.Pauli, invert0: bool, pauli1: pauli_gates.Pauli, invert1: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the read-only projectors onto the 0 and 1 eigenspaces of the interaction."""
+    comp1 = np.kron(PAULI_EIGEN_MAP[pauli0][not invert0], PAULI_EIGEN_MAP[pauli1][not invert1])
+    comp0 = np.eye(4) - comp1
+    comp0.setflags(write=False)
+    comp1.setflags(write=False)
+    return comp0, comp1
+
+
+@functools.cache
+def _z_to_cliffords(
+    pauli: pauli_gates.Pauli, invert: bool
+) -> Tuple[SingleQubitCliffordGate, SingleQubitCliffordGate]:
+    """Returns the Clifford taking Z to the (possibly inverted) pauli, and its inverse."""
+    gate = SingleQubitCliffordGate.from_single_map(z_to=(pauli, invert))
+    return gate, gate**-1
+
+
 @value.value_equality
 class PauliInteractionGate(gate_features.InterchangeableQubitsGate, eigen_gate.EigenGate):
     """A CZ conjugated by arbitrary single qubit Cliffords."""
@@ -101,20 +123,13 @@ class PauliInteractionGate(gate_features.InterchangeableQubitsGate, eigen_gate.E
         return [0.0, 1.0]
 
     def _eigen_components(self) -> List[Tuple[float, np.ndarray]]:
-        comp1 = np.kron(
-            PAULI_EIGEN_MAP[self.pauli0][not self.invert0],
-            PAULI_EIGEN_MAP[self.pauli1][not self.invert1],
-        )
-        comp0 = np.eye(4) - comp1
+        comp0, comp1 = _eigen_projectors(self.pauli0, self.invert0, self.pauli1, self.invert1)
         return [(0, comp0), (1, comp1)]
 
     def _decompose_(self, qubits: Sequence['cirq.Qid']) -> Iterator['cirq.OP_TREE']:
         q0, q1 = qubits
-        right_gate0 = SingleQubitCliffordGate.from_single_map(z_to=(self.pauli0, self.invert0))
-        right_gate1 = SingleQubitCliffordGate.from_single_map(z_to=(self.pauli1, self.invert1))
-
-        left_gate0 = right_gate0**-1
-        left_gate1 = right_gate1**-1
+        right_gate0, left_gate0 = _z_to_cliffords(self.pauli0, self.invert0)
+        right_gate1, left_gate1 = _z_to_cliffords(self.pauli1, self.invert1)
         yield left_gate0(q0)
         yield left_gate1(q1)
         yield common_gates.CZ(q0, q1) ** self._exponent
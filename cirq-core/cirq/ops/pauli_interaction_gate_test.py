@@ -94,6 +94,17 @@ def test_exponent():
     )
 
 
+def test_eigen_components_are_shared_and_read_only():
+    gate = cirq.PauliInteractionGate(cirq.Y, True, cirq.X, False, exponent=0.5)
+    same_axes = cirq.PauliInteractionGate(cirq.Y, True, cirq.X, False, exponent=0.25)
+    for (_, component), (_, other) in zip(gate._eigen_components(), same_axes._eigen_components()):
+        assert component is other
+        assert not component.flags.writeable
+    np.testing.assert_allclose(
+        sum(component for _, component in gate._eigen_components()), np.eye(4)
+    )
+
+
 def test_repr():
     cnot = cirq.PauliInteractionGate(cirq.Z, False, cirq.X, False)
     cirq.testing.assert_equivalent_repr(cnot)
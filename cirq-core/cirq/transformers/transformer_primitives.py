@@ -773,7 +773,7 @@ def unroll_circuit_op_greedy_frontier(
         Copy of input circuit with (Tagged) CircuitOperation's expanded inline at qubit frontier.
     """
     unrolled_circuit = circuit.unfreeze(copy=True)
-    frontier: Dict['cirq.Qid', int] = defaultdict(lambda: 0)
+    frontier: Dict['cirq.Qid', int] = defaultdict(int)
     idx = 0
     while idx < len(unrolled_circuit):
         for op in unrolled_circuit[idx].operations:
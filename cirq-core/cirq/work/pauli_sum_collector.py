@@ -58,8 +58,8 @@ class PauliSumCollector(collector.Collector):
             if not p:
                 self._identity_offset += p.coefficient
 
-        self._zeros: Dict[ops.PauliString, int] = collections.defaultdict(lambda: 0)
-        self._ones: Dict[ops.PauliString, int] = collections.defaultdict(lambda: 0)
+        self._zeros: Dict[ops.PauliString, int] = collections.defaultdict(int)
+        self._ones: Dict[ops.PauliString, int] = collections.defaultdict(int)
         self._samples_per_term = samples_per_term
         self._total_samples_requested = 0
 
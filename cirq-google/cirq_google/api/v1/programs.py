@@ -201,16 +201,8 @@ def pack_results(measurements: Sequence[Tuple[str, np.ndarray]]) -> bytes:
     bits = np.hstack([np.asarray(data, dtype=bool) for _, data in measurements])
     bits = bits.reshape(-1)
 
-    # Pad length to multiple of 8 if needed.
-    remainder = len(bits) % 8
-    if remainder:
-        bits = np.pad(bits, (0, 8 - remainder), 'constant')
-
-    # Pack in little-endian bit order.
-    bits = bits.reshape((-1, 8))[:, ::-1]
-    byte_arr = np.packbits(bits, axis=1).reshape(-1)
-
-    return byte_arr.tobytes()
+    # Pack in little-endian bit order, padding the final byte with zeros.
+    return np.packbits(bits, bitorder='little').tobytes()
 
 
 def unpack_results(
@@ -232,9 +224,10 @@ def unpack_results(
     bits_per_rep = sum(size for _, size in key_sizes)
     total_bits = repetitions * bits_per_rep
 
-    byte_arr = np.frombuffer(data, dtype='uint8').reshape((len(data), 1))
-    bits = np.unpackbits(byte_arr, axis=1)[:, ::-1].reshape(-1).astype(bool)
-    bits = bits[:total_bits].reshape((repetitions, bits_per_rep))
+    byte_arr = np.frombuffer(data, dtype=np.uint8)
+    # Unpacked bits are 0/1 bytes, so they can be reinterpreted as bools without a copy.
+    bits = np.unpackbits(byte_arr, bitorder='little')[:total_bits].view(bool)
+    bits = bits.reshape((repetitions, bits_per_rep))
 
     results = {}
     ofs = 0
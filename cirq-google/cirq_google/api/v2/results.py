@@ -87,23 +87,15 @@ def _grid_qubits(op: cirq.Operation) -> List[cirq.GridQubit]:
 
 def pack_bits(bits: np.ndarray) -> bytes:
     """Pack bits given as a numpy array of bools into bytes."""
-    # Pad length to multiple of 8 if needed.
-    pad = -len(bits) % 8
-    if pad:
-        bits = np.pad(bits, (0, pad), 'constant')
-
-    # Pack in little-endian bit order.
-    bits = bits.reshape((-1, 8))[:, ::-1]
-    byte_arr = np.packbits(bits, axis=1).reshape(-1)
-
-    return byte_arr.tobytes()
+    # Pack in little-endian bit order, padding the final byte with zeros.
+    return np.packbits(bits, bitorder='little').tobytes()
 
 
 def unpack_bits(data: bytes, repetitions: int) -> np.ndarray:
     """Unpack bits from a byte array into numpy array of bools."""
-    byte_arr = np.frombuffer(data, dtype='uint8').reshape((len(data), 1))
-    bits = np.unpackbits(byte_arr, axis=1)[:, ::-1].reshape(-1).astype(bool)
-    return bits[:repetitions]
+    byte_arr = np.frombuffer(data, dtype=np.uint8)
+    # Unpacked bits are 0/1 bytes, so they can be reinterpreted as bools without a copy.
+    return np.unpackbits(byte_arr, bitorder='little')[:repetitions].view(bool)
 
 
 def results_to_proto(
@@ -188,23 +180,27 @@ def _trial_sweep_from_proto(
         ValueError: If a qubit already exists in the measurement results.
     """
 
+    # Read protobuf fields once, outside the per-qubit loop.
+    repetitions = msg.repetitions
     trial_sweep: List[cirq.Result] = []
     for pr in msg.parameterized_results:
         records: Dict[str, np.ndarray] = {}
         for mr in pr.measurement_results:
+            key = mr.key
             instances = max(mr.instances, 1)
+            total_reps = repetitions * instances
             qubit_results: OrderedDict[cirq.GridQubit, np.ndarray] = OrderedDict()
             for qmr in mr.qubit_measurement_results:
                 qubit = v2.grid_qubit_from_proto_id(qmr.qubit.id)
                 if qubit in qubit_results:
                     raise ValueError(f'Qubit already exists: {qubit}.')
-                qubit_results[qubit] = unpack_bits(qmr.results, msg.repetitions * instances)
+                qubit_results[qubit] = unpack_bits(qmr.results, total_reps)
             if measure_map:
-                ordered_results = [qubit_results[qubit] for qubit in measure_map[mr.key].qubits]
+                ordered_results = [qubit_results[qubit] for qubit in measure_map[key].qubits]
             else:
                 ordered_results = list(qubit_results.values())
-            shape = (msg.repetitions, instances, len(qubit_results))
-            records[mr.key] = np.array(ordered_results).transpose().reshape(shape)
+            shape = (repetitions, instances, len(qubit_results))
+            records[key] = np.array(ordered_results).transpose().reshape(shape)
         trial_sweep.append(
             cirq.ResultDict(params=cirq.ParamResolver(dict(pr.params.assignments)), records=records)
         )
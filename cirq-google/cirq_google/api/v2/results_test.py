@@ -14,6 +14,7 @@ def test_pack_bits(reps):
     assert isinstance(packed, bytes)
     assert len(packed) == (reps + 7) // 8
     unpacked = v2.unpack_bits(packed, reps)
+    assert unpacked.dtype == bool
     np.testing.assert_array_equal(unpacked, data)
 
 